@@ -2,16 +2,54 @@
 
 import sys
 import signal
+import socket
+import logging
+import logging.handlers
+import queue
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QAction
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
 
 from .config import ConfigManager, ReminderConfig
 from .scheduler import ReminderScheduler
-from .overlay import ReminderOverlay
+
+# QtWidgets/QtGui and the overlay are imported where they're used, so that
+# error paths (missing config, example config creation) don't pay for them.
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QSocketNotifier
+    from PyQt6.QtGui import QIcon, QPixmap
+    from PyQt6.QtWidgets import QSystemTrayIcon
+    from .overlay import ReminderOverlay
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class SigintHandler:
+    """
+    A SIGINT handler installed by install_sigint_handler().
+    
+    Holds the notifier and both ends of its socket pair, which must stay alive
+    for as long as the handler is needed, and the state it replaced.
+    """
+    notifier: "QSocketNotifier"
+    read_sock: socket.socket
+    write_sock: socket.socket
+    previous_handler: Any
+    previous_wakeup_fd: int
+    
+    def uninstall(self) -> None:
+        """Restore the previous SIGINT handler and wakeup fd, and close the socket pair."""
+        signal.signal(signal.SIGINT, self.previous_handler)
+        signal.set_wakeup_fd(self.previous_wakeup_fd)
+        self.notifier.setEnabled(False)
+        self.read_sock.close()
+        self.write_sock.close()
 
 
 class ReminderTrigger(QObject):
@@ -30,20 +68,28 @@ class ReminderApp(QObject):
     - System tray icon
     """
     
-    def __init__(self, config_dir: Optional[Path] = None, enable_tray: bool = True):
+    TRAY_ICON_CACHE = "tray_icon_v1.png"
+    
+    def __init__(
+        self,
+        config_dir: Optional[Path] = None,
+        enable_tray: bool = True,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize the ReminderApp.
         
         Args:
             config_dir: Optional custom config directory path
             enable_tray: Whether to enable the system tray icon
+            cache_dir: Optional custom cache directory path (for the parsed config and tray icon)
         """
         super().__init__()
         
-        self.config_manager = ConfigManager(config_dir)
+        self.config_manager = ConfigManager(config_dir, cache_dir=cache_dir)
         self.scheduler = ReminderScheduler()
-        self.overlay: Optional[ReminderOverlay] = None
-        self.tray_icon: Optional[QSystemTrayIcon] = None
+        self.overlay: Optional["ReminderOverlay"] = None
+        self.tray_icon: Optional["QSystemTrayIcon"] = None
         self._enable_tray = enable_tray
         
         # Bridge for thread-safe Qt signal emission
@@ -54,7 +100,10 @@ class ReminderApp(QObject):
         self.active_reminder: Optional[ReminderConfig] = None
         
         # Queue for reminders that come while another is showing
-        self.reminder_queue: list = []
+        self.reminder_queue: deque = deque()
+        
+        # Ctrl+C handling, installed by main() via install_sigint_handler()
+        self.sigint_handler: Optional[SigintHandler] = None
     
     def initialize(self, skip_scheduler: bool = False) -> bool:
         """
@@ -71,14 +120,15 @@ class ReminderApp(QObject):
             reminders = self.config_manager.load_config()
             
             if not reminders:
-                print("No reminders configured. Please add reminders to the config file.")
+                log.warning("No reminders configured. Please add reminders to the config file.")
                 return False
             
-            print(f"Loaded {len(reminders)} reminders:")
+            log.info("Loaded %d reminders:", len(reminders))
             for name, config in reminders.items():
-                print(f"  - {name}: {config.schedule}")
+                log.info("  - %s: %s", name, config.schedule)
             
             # Create overlay with general config settings
+            from .overlay import ReminderOverlay
             self.overlay = ReminderOverlay(general_config=self.config_manager.general)
             self.overlay.completed.connect(self._on_reminder_completed)
             self.overlay.snoozed.connect(self._on_reminder_snoozed)
@@ -99,13 +149,13 @@ class ReminderApp(QObject):
             return True
             
         except FileNotFoundError as e:
-            print(f"Error: {e}")
-            print("\nCreating example configuration...")
+            log.error("Error: %s", e)
+            log.info("Creating example configuration...")
             self.config_manager.create_example_config()
-            print(f"Please edit {self.config_manager.config_file} and restart.")
+            log.info("Please edit %s and restart.", self.config_manager.config_file)
             return False
         except Exception as e:
-            print(f"Error initializing application: {e}")
+            log.error("Error initializing application: %s", e)
             return False
     
     def initialize_minimal(self, reminders: dict) -> bool:
@@ -121,6 +171,7 @@ class ReminderApp(QObject):
         self.config_manager.reminders = reminders
         
         # Create overlay
+        from .overlay import ReminderOverlay
         self.overlay = ReminderOverlay()
         self.overlay.completed.connect(self._on_reminder_completed)
         self.overlay.snoozed.connect(self._on_reminder_snoozed)
@@ -138,11 +189,10 @@ class ReminderApp(QObject):
             True if the reminder was found and triggered
         """
         if name not in self.config_manager.reminders:
-            print(f"Unknown reminder: {name}")
+            log.warning("Unknown reminder: %s", name)
             return False
         
-        config = self.config_manager.reminders[name]
-        self._show_reminder(config)
+        self._trigger_reminder_threadsafe(name)
         return True
     
     def trigger_reminder_config(self, config: ReminderConfig):
@@ -156,23 +206,10 @@ class ReminderApp(QObject):
     
     def _setup_tray(self):
         """Set up the system tray icon."""
-        # Create a simple icon
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor("transparent"))
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor("#4CAF50"))
-        painter.setPen(QColor("#388E3C"))
-        painter.drawEllipse(2, 2, 28, 28)
-        painter.setPen(QColor("white"))
-        font = painter.font()
-        font.setPointSize(16)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), 0x0084, "⏰")  # AlignCenter
-        painter.end()
+        from PyQt6.QtGui import QAction
+        from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
         
-        icon = QIcon(pixmap)
+        icon = self._load_tray_icon()
         
         self.tray_icon = QSystemTrayIcon(icon)
         self.tray_icon.setToolTip("Reminder System")
@@ -206,24 +243,92 @@ class ReminderApp(QObject):
         self.tray_icon.setContextMenu(menu)
         self.tray_icon.show()
     
+    def _load_tray_icon(self) -> "QIcon":
+        """
+        Load the tray icon, rendering it once and caching it as a PNG in the cache directory.
+        
+        The pixmap is also kept in QPixmapCache so that setting the tray up
+        again in the same process doesn't decode the PNG a second time.
+        Bump TRAY_ICON_CACHE's version suffix whenever the drawing code changes.
+        """
+        from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache
+        
+        pixmap = QPixmapCache.find(self.TRAY_ICON_CACHE)
+        if pixmap is not None:
+            return QIcon(pixmap)
+        
+        # No disk cache when ConfigManager caching is turned off
+        cache_dir = self.config_manager.cache_dir
+        icon_cache = cache_dir / self.TRAY_ICON_CACHE if cache_dir is not None else None
+        
+        # A missing file and a truncated or unreadable one both decode to a null
+        # pixmap; either way, render the icon again and overwrite the cache
+        pixmap = QPixmap(str(icon_cache)) if icon_cache is not None else QPixmap()
+        if pixmap.isNull():
+            pixmap = self._render_tray_icon()
+            if icon_cache is not None:
+                self._save_tray_icon(pixmap, icon_cache)
+        
+        QPixmapCache.insert(self.TRAY_ICON_CACHE, pixmap)
+        return QIcon(pixmap)
+    
+    def _save_tray_icon(self, pixmap: "QPixmap", icon_cache: Path) -> None:
+        """Write the rendered tray icon to the cache; failures are logged, not raised."""
+        try:
+            icon_cache.parent.mkdir(parents=True, exist_ok=True)
+            saved = pixmap.save(str(icon_cache), "PNG")
+        except OSError:
+            saved = False
+        if not saved:
+            log.warning("Could not cache tray icon at %s", icon_cache)
+    
+    def _render_tray_icon(self) -> "QPixmap":
+        """Draw the tray icon."""
+        from PyQt6.QtGui import QPixmap, QPainter, QColor
+        
+        # Create a simple icon
+        pixmap = QPixmap(32, 32)
+        pixmap.fill(QColor("transparent"))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QColor("#4CAF50"))
+        painter.setPen(QColor("#388E3C"))
+        painter.drawEllipse(2, 2, 28, 28)
+        painter.setPen(QColor("white"))
+        font = painter.font()
+        font.setPointSize(16)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), 0x0084, "⏰")  # AlignCenter
+        painter.end()
+        
+        return pixmap
+    
     def _trigger_reminder_threadsafe(self, name: str):
-        """Thread-safe method to trigger a reminder."""
-        # Emit signal to main thread
-        self.trigger.triggered.emit(name)
+        """
+        Thread-safe method to trigger a reminder.
+        
+        Used both by the scheduler thread and by manual triggers on the main
+        thread, so a reminder that is already showing queues the new one.
+        """
+        if QThread.currentThread() == self.thread():
+            # Already on the main thread - skip the queued signal round-trip
+            self._on_reminder_triggered(name)
+        else:
+            # Emit signal to main thread
+            self.trigger.triggered.emit(name)
     
     def _on_reminder_triggered(self, name: str):
         """Handle a reminder being triggered (main thread)."""
-        print(f"Reminder triggered: {name}")
+        log.info("Reminder triggered: %s", name)
         
-        if name not in self.config_manager.reminders:
-            print(f"Warning: Unknown reminder '{name}'")
+        if (config := self.config_manager.reminders.get(name)) is None:
+            log.warning("Unknown reminder '%s'", name)
             return
         
-        config = self.config_manager.reminders[name]
-        
         # If overlay is already showing, queue this reminder
         if self.active_reminder is not None:
-            print(f"Queueing reminder: {name}")
+            log.info("Queueing reminder: %s", name)
             self.reminder_queue.append(config)
             return
         
@@ -241,14 +346,14 @@ class ReminderApp(QObject):
     
     def _on_reminder_completed(self, name: str):
         """Handle reminder being marked as complete."""
-        print(f"Reminder completed: {name}")
+        log.info("Reminder completed: %s", name)
         self.scheduler.complete_reminder(name)
         self.active_reminder = None
         self._process_queue()
     
     def _on_reminder_snoozed(self, name: str, duration: int):
         """Handle reminder being snoozed."""
-        print(f"Reminder snoozed: {name} for {duration}s")
+        log.info("Reminder snoozed: %s for %ds", name, duration)
         self.scheduler.snooze_reminder(name, duration)
         self.active_reminder = None
         self._process_queue()
@@ -256,47 +361,110 @@ class ReminderApp(QObject):
     def _process_queue(self):
         """Process queued reminders."""
         if self.reminder_queue:
-            next_reminder = self.reminder_queue.pop(0)
+            next_reminder = self.reminder_queue.popleft()
             # Small delay before showing next
-            QTimer.singleShot(500, lambda: self._show_reminder(next_reminder))
+            QTimer.singleShot(500, partial(self._show_reminder, next_reminder))
     
     def _show_status(self):
         """Show the status of all reminders."""
         status = self.scheduler.get_status()
-        print("\n=== Reminder Status ===")
+        lines = ["=== Reminder Status ==="]
         for name, info in status.items():
-            print(f"\n{name}:")
-            print(f"  Next run: {info['effective_next']}")
+            lines.append(f"{name}:")
+            lines.append(f"  Next run: {info['effective_next']}")
             if info['snoozed_until']:
-                print(f"  Snoozed until: {info['snoozed_until']}")
-        print("=" * 24 + "\n")
+                lines.append(f"  Snoozed until: {info['snoozed_until']}")
+        lines.append("=" * 24)
+        log.info("\n".join(lines))
     
     def _test_reminder(self):
         """Trigger a test reminder."""
         if self.config_manager.reminders:
             # Get first reminder for testing
-            name = list(self.config_manager.reminders.keys())[0]
-            config = self.config_manager.reminders[name]
-            print(f"Testing reminder: {name}")
-            self._show_reminder(config)
+            name = next(iter(self.config_manager.reminders))
+            log.info("Testing reminder: %s", name)
+            self._trigger_reminder_threadsafe(name)
         else:
-            print("No reminders configured")
+            log.info("No reminders configured")
     
     def _quit(self):
         """Quit the application."""
-        print("Shutting down...")
+        from PyQt6.QtWidgets import QApplication
+        
+        log.info("Shutting down...")
         self.scheduler.stop()
         QApplication.quit()
     
     def run(self):
         """Start the application."""
         self.scheduler.start()
-        print("\nReminder system is running. Use the system tray icon to access options.")
-        print("Press Ctrl+C to quit.\n")
+        log.info("Reminder system is running. Use the system tray icon to access options.")
+        log.info("Press Ctrl+C to quit.")
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Log reminder_system messages to stdout from a background thread.
+    
+    Callers on the GUI and scheduler threads only enqueue records, so a slow
+    terminal can never block them on the stdout lock. Calling this again
+    replaces the queue handler installed by the previous call.
+    
+    Returns:
+        The started listener; call stop() on exit to flush pending records
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    
+    package_logger = logging.getLogger("reminder_system")
+    package_logger.setLevel(logging.INFO)
+    for handler in package_logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            package_logger.removeHandler(handler)
+    package_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def install_sigint_handler(handler: Callable[[], None]) -> SigintHandler:
+    """
+    Run handler on SIGINT, waking the Qt event loop only when a signal arrives.
+    
+    Python signal handlers only run when the interpreter regains control, which
+    doesn't happen while Qt's event loop is blocked. Instead of polling with a
+    timer, the signal's wakeup fd is watched by a QSocketNotifier.
+    
+    Args:
+        handler: Function to call when SIGINT is received
+        
+    Returns:
+        The installed handler; keep a reference to it for as long as it is needed
+    """
+    from PyQt6 import sip
+    from PyQt6.QtCore import QSocketNotifier
+    
+    read_sock, write_sock = socket.socketpair()
+    read_sock.setblocking(False)
+    write_sock.setblocking(False)
+    previous_wakeup_fd = signal.set_wakeup_fd(write_sock.fileno())
+    previous_handler = signal.signal(signal.SIGINT, lambda *args: handler())
+    
+    notifier = QSocketNotifier(sip.voidptr(read_sock.fileno()), QSocketNotifier.Type.Read)
+    # Draining the socket hands control back to Python, which runs the handler
+    notifier.activated.connect(lambda *args: read_sock.recv(64))
+    return SigintHandler(notifier, read_sock, write_sock, previous_handler, previous_wakeup_fd)
 
 
 def main():
     """Main entry point."""
+    from PyQt6.QtWidgets import QApplication
+    
+    log_listener = setup_logging()
+    
     # Create Qt application
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # Keep running with just tray icon
@@ -306,21 +474,19 @@ def main():
     reminder_app = ReminderApp()
     
     if not reminder_app.initialize():
+        log_listener.stop()
         sys.exit(1)
     
     # Handle SIGINT (Ctrl+C)
-    signal.signal(signal.SIGINT, lambda *args: reminder_app._quit())
-    
-    # Timer to allow signal handling
-    timer = QTimer()
-    timer.timeout.connect(lambda: None)
-    timer.start(500)
+    reminder_app.sigint_handler = install_sigint_handler(reminder_app._quit)
     
     # Start the application
     reminder_app.run()
     
     # Run Qt event loop
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    log_listener.stop()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 """Configuration parser for the reminder system."""
 
-import tomllib
-from dataclasses import dataclass, field
+import functools
+import hashlib
+import logging
+import os
+import struct
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
+log = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class GeneralConfig:
     """General settings for the reminder system."""
     text_font: str = "Sans Serif"
@@ -17,19 +23,20 @@ class GeneralConfig:
     fade_out_duration: int = 500  # milliseconds
     
     @classmethod
-    def from_dict(cls, settings: dict) -> "GeneralConfig":
-        """Create a GeneralConfig from a dictionary."""
-        return cls(
-            text_font=settings.get("text_font", "Sans Serif"),
-            text_size=settings.get("text_size", 24),
-            icon_scale=settings.get("icon_scale", 1.0),
-            max_opacity=settings.get("max_opacity", 0.85),
-            fade_in_duration=settings.get("fade_in_duration", 2000),
-            fade_out_duration=settings.get("fade_out_duration", 500),
-        )
+    def from_dict(cls, settings: Dict[str, Any]) -> "GeneralConfig":
+        """Create a GeneralConfig from a dictionary; missing keys keep their defaults."""
+        return cls(**{key: value for key, value in settings.items() if key in _GENERAL_FIELDS})
+
+
+# Keys accepted in the [general] section; anything else is ignored
+_GENERAL_FIELDS = frozenset(f.name for f in fields(GeneralConfig))
 
 
-@dataclass
+# Keys every reminder table must define
+_REQUIRED_REMINDER_FIELDS = frozenset({"schedule", "icon"})
+
+
+@dataclass(slots=True, frozen=True)
 class ReminderConfig:
     """Configuration for a single reminder."""
     name: str
@@ -38,33 +45,30 @@ class ReminderConfig:
     snooze_duration: int  # Seconds
     icon_path: Path  # Full path to the icon
     text: Optional[str] = None  # Optional text to display under the icon
-
-    def __post_init__(self):
-        if isinstance(self.icon_path, str):
-            self.icon_path = Path(self.icon_path)
     
     @classmethod
-    def from_dict(cls, name: str, settings: dict, config_dir: Path) -> "ReminderConfig":
+    def from_dict(cls, name: str, settings: Dict[str, Any], config_dir: Path) -> "ReminderConfig":
         """Create a ReminderConfig from a dictionary."""
-        if "schedule" not in settings:
-            raise ValueError(f"Reminder '{name}' is missing 'schedule' field")
-        if "icon" not in settings:
-            raise ValueError(f"Reminder '{name}' is missing 'icon' field")
+        missing = _REQUIRED_REMINDER_FIELDS - settings.keys()
+        if missing:
+            names = ", ".join(f"'{key}'" for key in sorted(missing))
+            plural = "s" if len(missing) > 1 else ""
+            raise ValueError(f"Reminder '{name}' is missing {names} field{plural}")
         
+        schedule = settings["schedule"]
         icon_filename = settings["icon"]
-        icon_path = config_dir / icon_filename
         
         return cls(
             name=name,
-            schedule=settings["schedule"],
+            schedule=schedule,
             icon=icon_filename,
             snooze_duration=settings.get("snooze_duration", 300),
-            icon_path=icon_path,
-            text=settings.get("text", None)
+            icon_path=config_dir / icon_filename,
+            text=settings.get("text")
         )
 
 
-def parse_config_data(config_data: dict, config_dir: Path) -> tuple[Dict[str, ReminderConfig], GeneralConfig]:
+def parse_config_data(config_data: Dict[str, Any], config_dir: Path) -> tuple[Dict[str, ReminderConfig], GeneralConfig]:
     """
     Parse configuration data into ReminderConfig objects and GeneralConfig.
     
@@ -75,29 +79,45 @@ def parse_config_data(config_data: dict, config_dir: Path) -> tuple[Dict[str, Re
     Returns:
         Tuple of (dictionary mapping reminder names to ReminderConfig objects, GeneralConfig)
     """
-    reminders = {}
-    general_config = GeneralConfig()
+    # Handle [general] section separately
+    general_settings = config_data.get("general")
+    if isinstance(general_settings, dict):
+        general_config = GeneralConfig.from_dict(general_settings)
+    else:
+        general_config = GeneralConfig()
     
-    for name, settings in config_data.items():
-        if not isinstance(settings, dict):
-            continue
-        
-        # Handle [general] section separately
-        if name == "general":
-            general_config = GeneralConfig.from_dict(settings)
-            continue
-        
-        reminder = ReminderConfig.from_dict(name, settings, config_dir)
-        
-        if not reminder.icon_path.exists():
-            print(f"Warning: Icon file not found: {reminder.icon_path}")
-        
-        reminders[name] = reminder
+    # Every other table is a reminder; non-table values are skipped
+    reminders = {
+        name: ReminderConfig.from_dict(name, settings, config_dir)
+        for name, settings in config_data.items()
+        if name != "general" and isinstance(settings, dict)
+    }
+    
+    _warn_missing_icons(reminders, config_dir)
     
     return reminders, general_config
 
 
-def load_config_file(config_file: Path) -> dict:
+def _warn_missing_icons(reminders: Dict[str, ReminderConfig], config_dir: Path) -> None:
+    """Log a warning for every reminder whose icon file doesn't exist."""
+    # List the config directory once instead of stat'ing every icon path
+    try:
+        present = {entry.name for entry in os.scandir(config_dir) if entry.is_file()}
+    except OSError:
+        present = set()
+    
+    for reminder in reminders.values():
+        if reminder.icon_path.parent == config_dir:
+            icon_exists = reminder.icon_path.name in present
+        else:
+            # Icon lives outside the config dir (subdirectory or absolute path)
+            icon_exists = reminder.icon_path.exists()
+        
+        if not icon_exists:
+            log.warning("Icon file not found: %s", reminder.icon_path)
+
+
+def load_config_file(config_file: Path) -> Dict[str, Any]:
     """Load and parse a TOML configuration file."""
     if not config_file.exists():
         raise FileNotFoundError(
@@ -105,6 +125,27 @@ def load_config_file(config_file: Path) -> dict:
             f"Please create a config file at {config_file}"
         )
     
+    # Parsers are imported lazily - only needed when the cache can't be used.
+    # Prefer the native rtoml (the "fast" extra) or pytomlpp, then fall back to tomllib.
+    config_data: Dict[str, Any]
+    try:
+        import rtoml
+    except ImportError:
+        pass
+    else:
+        config_data = rtoml.load(config_file)
+        return config_data
+    
+    try:
+        import pytomlpp  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        pass
+    else:
+        config_data = pytomlpp.load(config_file)
+        return config_data
+    
+    import tomllib
+    
     with open(config_file, "rb") as f:
         return tomllib.load(f)
 
@@ -112,26 +153,145 @@ def load_config_file(config_file: Path) -> dict:
 class ConfigManager:
     """Manages loading and parsing of the reminder configuration."""
     
-    DEFAULT_CONFIG_DIR = Path.home() / ".config" / "reminder-system"
     CONFIG_FILE = "config.toml"
     
-    def __init__(self, config_dir: Optional[Path] = None):
-        self.config_dir = Path(config_dir) if config_dir else self.DEFAULT_CONFIG_DIR
+    # Bump whenever ReminderConfig/GeneralConfig or the header change shape, so old pickles are ignored
+    CACHE_VERSION = 3
+    
+    # Cache header: (CACHE_VERSION, st_mtime_ns, st_size, st_ino) of the TOML file it was built
+    # from and the length of the config_dir path, which follows the struct. The pickled icon
+    # paths are built from config_dir as given, so a cache is only valid for the same spelling.
+    _CACHE_HEADER = struct.Struct("<IQQQI")
+    
+    def __init__(
+        self,
+        config_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True
+    ) -> None:
+        """
+        Args:
+            config_dir: Directory holding config.toml (default: ~/.config/reminder-system)
+            cache_dir: Directory for cache files (default: $XDG_CACHE_HOME/reminder-system)
+            use_cache: Whether to cache the parsed config on disk at all
+        """
+        self.config_dir = Path(config_dir) if config_dir else self._default_config_dir()
         self.config_file = self.config_dir / self.CONFIG_FILE
+        # Cache files never go into config_dir, which may be a read-only or
+        # version-controlled directory such as the test fixtures
+        self.cache_dir: Optional[Path] = None
+        self.cache_file: Optional[Path] = None
+        if use_cache:
+            self.cache_dir = Path(cache_dir) if cache_dir else self._default_cache_dir()
+            # One cache file per config directory, so several configs can share cache_dir
+            digest = hashlib.sha256(os.fsencode(self.config_dir)).hexdigest()[:16]
+            self.cache_file = self.cache_dir / f"config-{digest}.cache"
         self.reminders: Dict[str, ReminderConfig] = {}
         self.general: GeneralConfig = GeneralConfig()
+        
+        # In-memory memo of the last load_config() result, keyed on the cache header
+        self._cache_key: Optional[bytes] = None
+        self._cache_value: Optional[tuple[Dict[str, ReminderConfig], GeneralConfig]] = None
+    
+    @staticmethod
+    @functools.cache
+    def _default_config_dir() -> Path:
+        """Resolve ~/.config/reminder-system on first use rather than at import."""
+        return Path.home() / ".config" / "reminder-system"
+    
+    @staticmethod
+    @functools.cache
+    def _default_cache_dir() -> Path:
+        """Resolve $XDG_CACHE_HOME/reminder-system (~/.cache/reminder-system) on first use."""
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+        base = Path(cache_home) if cache_home else Path.home() / ".cache"
+        return base / "reminder-system"
     
     def ensure_config_dir(self) -> None:
         """Create the config directory if it doesn't exist."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
     def load_config(self) -> Dict[str, ReminderConfig]:
-        """Load and parse the configuration file."""
+        """
+        Load and parse the configuration file.
+        
+        The parsed result is cached in cache_file and reused as long
+        as the TOML file's mtime, size and inode and the config directory are
+        unchanged. Repeated calls on the same manager only stat the file. Icon
+        files are checked on every load, cached or not.
+        """
+        header = self._cache_header() if self.cache_file is not None else None
+        
+        if header is not None:
+            if header == self._cache_key and self._cache_value is not None:
+                self.reminders, self.general = self._cache_value
+                _warn_missing_icons(self.reminders, self.config_dir)
+                return self.reminders
+            
+            cached = self._read_cache(header)
+            if cached is not None:
+                self.reminders, self.general = cached
+                self._cache_key, self._cache_value = header, cached
+                _warn_missing_icons(self.reminders, self.config_dir)
+                return self.reminders
+        
         config_data = load_config_file(self.config_file)
         self.reminders, self.general = parse_config_data(config_data, self.config_dir)
+        
+        if header is not None:
+            self._write_cache(header)
+            self._cache_key, self._cache_value = header, (self.reminders, self.general)
+        
         return self.reminders
     
-    def load_from_data(self, config_data: dict) -> Dict[str, ReminderConfig]:
+    def _cache_header(self) -> Optional[bytes]:
+        """Build the cache key for the current config file, or None if it can't be stat'ed."""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        config_dir = os.fsencode(self.config_dir)
+        return self._CACHE_HEADER.pack(
+            self.CACHE_VERSION, stat.st_mtime_ns, stat.st_size, stat.st_ino, len(config_dir)
+        ) + config_dir
+    
+    def _read_cache(self, header: bytes) -> Optional[tuple[Dict[str, ReminderConfig], GeneralConfig]]:
+        """Return the cached (reminders, general) pair if it matches the given header."""
+        import pickle
+        
+        if self.cache_file is None:
+            return None
+        try:
+            with open(self.cache_file, "rb") as f:
+                if f.read(len(header)) != header:
+                    return None
+                cached: tuple[Dict[str, ReminderConfig], GeneralConfig] = pickle.load(f)
+                return cached
+        except Exception:
+            # Missing, stale or unreadable cache - fall back to parsing the TOML file
+            return None
+    
+    def _write_cache(self, header: bytes) -> None:
+        """Atomically write the parsed config to the cache file; failures are logged, not raised."""
+        import pickle
+        
+        if self.cache_dir is None or self.cache_file is None:
+            return
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                f.write(header)
+                pickle.dump((self.reminders, self.general), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except (OSError, pickle.PicklingError) as e:
+            log.warning("Could not write config cache: %s", e)
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def load_from_data(self, config_data: Dict[str, Any]) -> Dict[str, ReminderConfig]:
         """Load reminders from already-parsed config data."""
         self.reminders, self.general = parse_config_data(config_data, self.config_dir)
         return self.reminders
@@ -174,4 +334,4 @@ text = "Look at something 20 feet away for 20 seconds"
         with open(self.config_file, "w") as f:
             f.write(example_config)
         
-        print(f"Created example config at: {self.config_file}")
+        log.info("Created example config at: %s", self.config_file)
@@ -1,21 +1,25 @@
 """Overlay window for displaying reminders."""
 
+import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Callable, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from PyQt6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, 
-    QSize, pyqtSignal, QRect, QPoint
+    Qt, QPropertyAnimation, QEasingCurve, 
+    QParallelAnimationGroup, QSequentialAnimationGroup,
+    pyqtSignal, QRect
 )
+# Exported at runtime but missing from PyQt6's type stubs
+from PyQt6.QtCore import pyqtProperty  # type: ignore[attr-defined]
 from PyQt6.QtGui import (
     QPixmap, QColor, QPainter, QBrush, QPen,
-    QScreen, QGuiApplication, QPainterPath, QRegion, QFont
+    QGuiApplication, QFont, QFontMetrics
 )
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, 
-    QHBoxLayout, QGraphicsOpacityEffect, QApplication,
-    QSizePolicy
+    QHBoxLayout, QGraphicsOpacityEffect, QSizePolicy
 )
 
 if TYPE_CHECKING:
@@ -30,43 +34,58 @@ class CircleButton(QPushButton):
         self.icon_text = icon_text
         self.base_color = color
         self.hover_color = hover_color
-        self.current_color = color
+        self._hovered = False
+        
+        # Paint objects are built once; paintEvent only picks between them
+        self._brush = QBrush(QColor(color))
+        self._hover_brush = QBrush(QColor(hover_color))
+        self._pen = QPen(QColor(color).darker(120), 2)
+        self._hover_pen = QPen(QColor(hover_color).darker(120), 2)
+        self._text_pen = QPen(QColor("white"))
+        self._font = QFont(self.font())
+        self._font.setPointSize(24)
+        self._font.setBold(True)
+        self._circle_rect = QRect(5, 5, 50, 50)
+        # Area touched by the circle including its antialiased 2px outline
+        self._paint_rect = self._circle_rect.adjusted(-2, -2, 2, 2)
+        
+        # Center the glyph using tightBoundingRect to get its actual visual bounds;
+        # the text and font never change, so this is computed once
+        circle_center_x = 5 + 25  # circle x + radius
+        circle_center_y = 5 + 25  # circle y + radius
+        tight_rect = QFontMetrics(self._font).tightBoundingRect(icon_text)
+        self._text_x = circle_center_x - tight_rect.width() // 2 - tight_rect.x()
+        self._text_y = circle_center_y - tight_rect.height() // 2 - tight_rect.y()
         
         self.setFixedSize(60, 60)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setStyleSheet("background: transparent; border: none;")
     
     def paintEvent(self, event):
+        # Everything outside the circle is transparent
+        if not event.rect().intersects(self._paint_rect):
+            return
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw circle background
-        painter.setBrush(QBrush(QColor(self.current_color)))
-        painter.setPen(QPen(QColor(self.current_color).darker(120), 2))
-        painter.drawEllipse(5, 5, 50, 50)
-        
-        # Draw icon text centered using tight bounding rect for accurate positioning
-        painter.setPen(QPen(QColor("white")))
-        font = painter.font()
-        font.setPointSize(24)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        # Use tightBoundingRect to get the actual visual bounds of the glyph
-        circle_center_x = 5 + 25  # circle x + radius
-        circle_center_y = 5 + 25  # circle y + radius
-        tight_rect = painter.fontMetrics().tightBoundingRect(self.icon_text)
-        x = circle_center_x - tight_rect.width() // 2 - tight_rect.x()
-        y = circle_center_y - tight_rect.height() // 2 - tight_rect.y()
-        painter.drawText(x, y, self.icon_text)
+        painter.setBrush(self._hover_brush if self._hovered else self._brush)
+        painter.setPen(self._hover_pen if self._hovered else self._pen)
+        painter.drawEllipse(self._circle_rect)
+        
+        # Draw icon text at the precomputed centered position
+        painter.setPen(self._text_pen)
+        painter.setFont(self._font)
+        painter.drawText(self._text_x, self._text_y, self.icon_text)
     
     def enterEvent(self, event):
-        self.current_color = self.hover_color
-        self.update()
+        self._hovered = True
+        self.update(self._paint_rect)
     
     def leaveEvent(self, event):
-        self.current_color = self.base_color
-        self.update()
+        self._hovered = False
+        self.update(self._paint_rect)
 
 
 class ReminderOverlay(QWidget):
@@ -90,6 +109,7 @@ class ReminderOverlay(QWidget):
     DEFAULT_FADE_IN_DURATION = 2000
     DEFAULT_FADE_OUT_DURATION = 500
     BACKGROUND_FADE_DELAY = 1000
+    BACKGROUND_TARGET_OPACITY = 0.7
     
     # Default styling
     DEFAULT_TEXT_FONT = "Sans Serif"
@@ -97,15 +117,23 @@ class ReminderOverlay(QWidget):
     DEFAULT_ICON_SCALE = 1.0
     DEFAULT_MAX_OPACITY = 0.85
     
+    # Number of scaled icons kept in memory
+    PIXMAP_CACHE_SIZE = 32
+    
     def __init__(self, parent=None, general_config: Optional["GeneralConfig"] = None):
         super().__init__(parent)
         
         self.reminder_name: str = ""
         self.snooze_duration: int = 300
-        self.background_opacity: float = 0.0
+        self._background_opacity: float = 0.0
+        self._background_color = QColor(0, 0, 0)
+        self._background_alpha: int = 0  # Alpha byte of the last painted background
         self.is_interactive: bool = False
         self.reminder_text: Optional[str] = None
         
+        # Scaled icons keyed by (path, scaled_size, mtime_ns), least recently used first
+        self._pixmap_cache: "OrderedDict[tuple[str, int, int], QPixmap]" = OrderedDict()
+        
         # Apply general config or use defaults
         if general_config:
             self.text_font = general_config.text_font
@@ -122,9 +150,11 @@ class ReminderOverlay(QWidget):
             self.fade_in_duration = self.DEFAULT_FADE_IN_DURATION
             self.fade_out_duration = self.DEFAULT_FADE_OUT_DURATION
         
+        # Widgets and animations are built on the first show_reminder() call,
+        # so a daemon that hasn't fired a reminder yet doesn't pay for them
+        self._ui_built = False
+        
         self._setup_window()
-        self._setup_ui()
-        self._setup_animations()
     
     def _setup_window(self):
         """Configure window properties for overlay behavior."""
@@ -163,10 +193,15 @@ class ReminderOverlay(QWidget):
         self.container_opacity.setOpacity(0.0)
         self.container.setGraphicsEffect(self.container_opacity)
         
-        # Icon label
+        # Icon label (the text styling only applies to the no-icon fallback)
         self.icon_label = QLabel()
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setStyleSheet("background: transparent;")
+        self.icon_label.setStyleSheet("""
+            background: transparent;
+            color: white;
+            font-size: 48px;
+            font-weight: bold;
+        """)
         
         container_layout.addWidget(self.icon_label)
         
@@ -221,39 +256,85 @@ class ReminderOverlay(QWidget):
         """)
     
     def _setup_animations(self):
-        """Set up the fade animations."""
+        """
+        Set up the fade animations.
+        
+        Showing runs one parallel group: the container fades in while the
+        background waits BACKGROUND_FADE_DELAY, fades in, then pauses briefly
+        before the overlay accepts input. Dismissing runs a second group that
+        fades both out and hides the window when it finishes.
+        """
         # Container fade-in animation (icon + text + buttons together)
         self.container_fade_anim = QPropertyAnimation(self.container_opacity, b"opacity")
         self.container_fade_anim.setDuration(self.fade_in_duration)
         self.container_fade_anim.setStartValue(0.0)
         self.container_fade_anim.setEndValue(1.0)
         self.container_fade_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        
-        # Background fade timer (we'll animate this manually)
-        self.bg_fade_timer = QTimer()
-        self.bg_fade_timer.setInterval(16)  # ~60 FPS
-        self.bg_fade_timer.timeout.connect(self._animate_background)
-        self.bg_target_opacity = 0.0
-        self.bg_fade_step = 0.0
-        
-        # Timer to start background fade after delay
-        self.bg_delay_timer = QTimer()
-        self.bg_delay_timer.setSingleShot(True)
-        self.bg_delay_timer.timeout.connect(self._start_background_fade)
-        
-        # Timer to make window interactive after fade completes
-        self.interactive_timer = QTimer()
-        self.interactive_timer.setSingleShot(True)
-        self.interactive_timer.timeout.connect(self._make_interactive)
+        self.container_fade_anim.finished.connect(self._on_container_fade_in_finished)
+        
+        # Background fade-in on the background_opacity property; it takes about
+        # 1.5x the container fade duration
+        self.bg_fade_in_anim = QPropertyAnimation(self, b"background_opacity")
+        self.bg_fade_in_anim.setDuration(int(self.fade_in_duration * 1.5))
+        self.bg_fade_in_anim.setStartValue(0.0)
+        self.bg_fade_in_anim.setEndValue(self.BACKGROUND_TARGET_OPACITY)
+        self.bg_fade_in_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        
+        # Delay, background fade-in, then a short pause before accepting clicks
+        background_sequence = QSequentialAnimationGroup(self)
+        background_sequence.addPause(self.BACKGROUND_FADE_DELAY)
+        background_sequence.addAnimation(self.bg_fade_in_anim)
+        background_sequence.addPause(200)
+        
+        self.show_anim = QParallelAnimationGroup(self)
+        self.show_anim.addAnimation(self.container_fade_anim)
+        self.show_anim.addAnimation(background_sequence)
+        self.show_anim.finished.connect(self._make_interactive)
+        
+        # Fade-outs have no start value, so each run starts from the current
+        # opacity - a dismissal can interrupt the fade-in at any point
+        self.container_fade_out_anim = QPropertyAnimation(self.container_opacity, b"opacity")
+        self.container_fade_out_anim.setDuration(self.fade_out_duration)
+        self.container_fade_out_anim.setEndValue(0.0)
+        
+        self.bg_fade_out_anim = QPropertyAnimation(self, b"background_opacity")
+        self.bg_fade_out_anim.setDuration(self.fade_out_duration)
+        self.bg_fade_out_anim.setEndValue(0.0)
+        
+        self.dismiss_anim = QParallelAnimationGroup(self)
+        self.dismiss_anim.addAnimation(self.container_fade_out_anim)
+        self.dismiss_anim.addAnimation(self.bg_fade_out_anim)
+        self.dismiss_anim.finished.connect(self.hide)
+    
+    def _get_background_opacity(self) -> float:
+        return self._background_opacity
+    
+    def _set_background_opacity(self, value: float):
+        self._background_opacity = value
+        # Only repaint the full-screen background when the visible alpha actually changes
+        alpha = int(255 * value * self.max_opacity)
+        if alpha != self._background_alpha:
+            self._background_alpha = alpha
+            self.update()
+    
+    # Exposed as a Qt property so QPropertyAnimation can drive it
+    background_opacity = pyqtProperty(float, fget=_get_background_opacity, fset=_set_background_opacity)
     
     def paintEvent(self, event):
         """Paint the semi-transparent background."""
+        # Nothing visible to draw before the background fade starts, after it ends,
+        # or while the fill would still round to a fully transparent alpha
+        if self._background_alpha == 0:
+            return
+        
+        # No antialiasing: the fill is an axis-aligned rectangle
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw semi-transparent black background using configurable max_opacity
-        color = QColor(0, 0, 0, int(255 * self.background_opacity * self.max_opacity))
-        painter.fillRect(self.rect(), color)
+        # Draw semi-transparent black background using configurable max_opacity,
+        # limited to the area Qt asked us to repaint. The color is fixed; only the
+        # painter opacity changes between frames.
+        painter.setOpacity(self._background_opacity * self.max_opacity)
+        painter.fillRect(event.rect(), self._background_color)
     
     def show_reminder(self, name: str, icon_path: Path, snooze_duration: int = 300, 
                        text: Optional[str] = None):
@@ -266,35 +347,27 @@ class ReminderOverlay(QWidget):
             snooze_duration: Snooze duration in seconds
             text: Optional text to display under the icon
         """
+        if not self._ui_built:
+            self._setup_ui()
+            self._setup_animations()
+            self._ui_built = True
+        
         self.reminder_name = name
         self.snooze_duration = snooze_duration
+        self.show_anim.stop()
+        self.dismiss_anim.stop()
         self.background_opacity = 0.0
         self.is_interactive = False
         self.reminder_text = text
         
-        # Calculate scaled icon size based on icon_scale
-        base_size = 200
-        scaled_size = int(base_size * self.icon_scale)
-        
         # Load and set the icon
-        if icon_path.exists():
-            pixmap = QPixmap(str(icon_path))
-            # Scale to size based on icon_scale while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                scaled_size, scaled_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        scaled_pixmap = self._load_icon(icon_path)
+        
+        if scaled_pixmap is not None:
             self.icon_label.setPixmap(scaled_pixmap)
         else:
             # Fallback: show reminder name as text
             self.icon_label.setText(f"⏰\n{name}")
-            self.icon_label.setStyleSheet("""
-                background: transparent;
-                color: white;
-                font-size: 48px;
-                font-weight: bold;
-            """)
         
         # Set up text label if text is provided
         if text:
@@ -304,6 +377,7 @@ class ReminderOverlay(QWidget):
             self.text_label.hide()
         
         # Reset container opacity
+        self.container_opacity.setEnabled(True)
         self.container_opacity.setOpacity(0.0)
         
         # Show window
@@ -311,35 +385,57 @@ class ReminderOverlay(QWidget):
         self.raise_()
         
         # Start animations - container and background fade together
-        self.container_fade_anim.setDuration(self.fade_in_duration)
-        self.container_fade_anim.start()
-        self.bg_delay_timer.start(self.BACKGROUND_FADE_DELAY)
-    
-    def _start_background_fade(self):
-        """Start the background fade animation."""
-        self.bg_target_opacity = 0.7
-        # Calculate step size for smooth animation based on fade_in_duration
-        # Background fade takes about 1.5x the container fade duration
-        bg_fade_duration = int(self.fade_in_duration * 1.5)
-        steps = bg_fade_duration / 16
-        self.bg_fade_step = self.bg_target_opacity / steps
-        self.bg_fade_timer.start()
-    
-    def _animate_background(self):
-        """Animate the background opacity."""
-        self.background_opacity += self.bg_fade_step
-        
-        if self.bg_fade_step > 0 and self.background_opacity >= self.bg_target_opacity:
-            self.background_opacity = self.bg_target_opacity
-            self.bg_fade_timer.stop()
-            
-            # Make window interactive after background is visible
-            self.interactive_timer.start(200)
-        elif self.bg_fade_step < 0 and self.background_opacity <= 0:
-            self.background_opacity = 0.0
-            self.bg_fade_timer.stop()
-        
-        self.update()
+        self.show_anim.start()
+    
+    def _scaled_icon_size(self) -> int:
+        """Return the icon size in pixels for the configured icon_scale."""
+        base_size = 200
+        return int(base_size * self.icon_scale)
+    
+    def _scale_icon(self, pixmap: QPixmap) -> QPixmap:
+        """Scale an icon to the configured size, maintaining aspect ratio."""
+        scaled_size = self._scaled_icon_size()
+        return pixmap.scaled(
+            scaled_size, scaled_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    
+    def _load_icon(self, icon_path: Path) -> Optional[QPixmap]:
+        """
+        Load and scale an icon, reusing the cached result while the file is unchanged.
+        
+        Returns:
+            The scaled pixmap, or None if the file is missing or can't be decoded
+        """
+        # Convert the Path once; the string is used for the stat, the cache key and QPixmap
+        path_str = str(icon_path)
+        try:
+            mtime_ns = os.stat(path_str).st_mtime_ns
+        except OSError:
+            return None
+        
+        key = (path_str, self._scaled_icon_size(), mtime_ns)
+        scaled_pixmap = self._pixmap_cache.get(key)
+        if scaled_pixmap is not None:
+            self._pixmap_cache.move_to_end(key)
+            return scaled_pixmap
+        
+        pixmap = QPixmap(path_str)
+        if pixmap.isNull():
+            return None
+        
+        scaled_pixmap = self._scale_icon(pixmap)
+        self._pixmap_cache[key] = scaled_pixmap
+        if len(self._pixmap_cache) > self.PIXMAP_CACHE_SIZE:
+            self._pixmap_cache.popitem(last=False)
+        return scaled_pixmap
+    
+    def _on_container_fade_in_finished(self):
+        """Stop compositing the container through the opacity effect once it's fully shown."""
+        # A disabled effect paints the container directly instead of through an
+        # offscreen pixmap; it is re-enabled whenever the container fades again
+        self.container_opacity.setEnabled(False)
     
     def _make_interactive(self):
         """Make the window interactive (accept clicks)."""
@@ -361,21 +457,14 @@ class ReminderOverlay(QWidget):
     
     def _dismiss(self):
         """Dismiss the overlay with fade-out animation."""
-        # Calculate fade step to match fade_out_duration
-        # step = current_opacity / (duration / interval)
-        steps = self.fade_out_duration / 16
-        self.bg_target_opacity = 0.0
-        self.bg_fade_step = -self.background_opacity / steps if steps > 0 else -0.05
-        self.bg_fade_timer.start()
-        
-        # Fade out container (icon + text + buttons together)
-        self._fade_out_container = QPropertyAnimation(self.container_opacity, b"opacity")
-        self._fade_out_container.setDuration(self.fade_out_duration)
-        self._fade_out_container.setEndValue(0.0)
-        self._fade_out_container.start()
-        
-        # Hide after animation
-        QTimer.singleShot(self.fade_out_duration + 100, self.hide)
+        # Ignore further clicks/keys while fading out
+        self.is_interactive = False
+        
+        self.show_anim.stop()
+        self.container_opacity.setEnabled(True)
+        
+        # Fade out container (icon + text + buttons) and background, then hide
+        self.dismiss_anim.start()
     
     def keyPressEvent(self, event):
         """Handle key presses."""
@@ -388,6 +477,8 @@ class ReminderOverlay(QWidget):
 
 def test_overlay():
     """Test the overlay window."""
+    from PyQt6.QtWidgets import QApplication
+    
     app = QApplication(sys.argv)
     
     overlay = ReminderOverlay()
@@ -1,12 +1,38 @@
 """Cron-based scheduler for reminders."""
 
+import copy
+import functools
+import heapq
+import itertools
+import logging
 import threading
-import time
 from datetime import datetime, timedelta
-from typing import Dict, Callable, Optional
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, List, Optional, Tuple
+from dataclasses import InitVar, dataclass, field
 
-from croniter import croniter
+from croniter import croniter, CroniterError
+
+log = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=128)
+def _parsed_cron(cron_expression: str) -> croniter:
+    """
+    Parse a cron expression once and cache the result.
+    
+    Treat the returned iterator as a read-only prototype: use _new_cron() to get
+    an iterator you can advance. Raises CroniterError for invalid expressions.
+    """
+    return croniter(cron_expression, datetime(1970, 1, 1))
+
+
+def _new_cron(cron_expression: str, start_time: datetime) -> croniter:
+    """Return a croniter for `cron_expression` positioned at `start_time`, reusing the parsed fields."""
+    # A shallow copy is enough: croniter never mutates its parsed field tables
+    cron = copy.copy(_parsed_cron(cron_expression))
+    cron.set_current(start_time, force=True)
+    return cron
 
 
 @dataclass
@@ -17,16 +43,25 @@ class ScheduledReminder:
     callback: Callable[[str], None]
     next_run: datetime
     snoozed_until: Optional[datetime] = None
+    # An already-parsed iterator for cron_expression, e.g. from validating it
+    parsed_cron: InitVar[Optional[croniter]] = None
+    cron: croniter = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self, parsed_cron: Optional[croniter]) -> None:
+        # Parse the cron expression once (unless already parsed) and reuse the iterator
+        if parsed_cron is None:
+            parsed_cron = _new_cron(self.cron_expression, self.next_run)
+        self.cron = parsed_cron
     
-    def calculate_next_run(self) -> datetime:
-        """Calculate the next run time based on the cron expression."""
-        cron = croniter(self.cron_expression, datetime.now())
-        self.next_run = cron.get_next(datetime)
+    def calculate_next_run(self, now: Optional[datetime] = None) -> datetime:
+        """Calculate the next run time after `now` (default: the current time)."""
+        self.cron.set_current(now or datetime.now(), force=True)
+        self.next_run = self.cron.get_next(datetime)
         return self.next_run
     
-    def snooze(self, seconds: int) -> datetime:
-        """Snooze the reminder for the specified duration."""
-        self.snoozed_until = datetime.now() + timedelta(seconds=seconds)
+    def snooze(self, seconds: int, now: Optional[datetime] = None) -> datetime:
+        """Snooze the reminder for the specified duration from `now` (default: the current time)."""
+        self.snoozed_until = (now or datetime.now()) + timedelta(seconds=seconds)
         return self.snoozed_until
     
     def clear_snooze(self):
@@ -34,9 +69,9 @@ class ScheduledReminder:
         self.snoozed_until = None
         self.calculate_next_run()
     
-    def get_effective_next_run(self) -> datetime:
+    def get_effective_next_run(self, now: Optional[datetime] = None) -> datetime:
         """Get the effective next run time considering snooze."""
-        if self.snoozed_until and self.snoozed_until > datetime.now():
+        if self.snoozed_until and self.snoozed_until > (now or datetime.now()):
             return self.snoozed_until
         return self.next_run
 
@@ -45,18 +80,29 @@ class ReminderScheduler:
     """
     Scheduler that triggers reminders based on cron expressions.
     
-    Uses a background thread to check for due reminders.
+    Uses a background thread to check for due reminders. Reminders are kept in
+    a min-heap ordered by their next due time, so each check only looks at the
+    reminders that are actually due.
     """
     
-    CHECK_INTERVAL = 1.0  # Check every second
+    CHECK_INTERVAL = 1.0  # Check at least every second
+    CALLBACK_WORKERS = 4  # Threads available for running reminder callbacks
     
     def __init__(self):
         self.reminders: Dict[str, ScheduledReminder] = {}
+        # Heap of (due time as a POSIX timestamp, sequence number, name). Entries
+        # are never removed in place; an entry is only live while its sequence
+        # number is the one recorded for that name in _heap_seq.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._heap_seq: Dict[str, int] = {}
+        self._seq = itertools.count()
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
-        self._triggered_this_minute: set = set()
-        self._last_minute: Optional[int] = None
+        # Set whenever the schedule changes or the scheduler stops, so the loop
+        # re-checks immediately instead of finishing its current wait
+        self._wake = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = self._create_executor()
     
     def add_reminder(
         self, 
@@ -72,43 +118,59 @@ class ReminderScheduler:
             cron_expression: Cron expression for scheduling
             callback: Function to call when reminder triggers
         """
-        # Validate cron expression
-        if not croniter.is_valid(cron_expression):
-            raise ValueError(f"Invalid cron expression: {cron_expression}")
+        # Parse (and validate) the cron expression once; the iterator is kept
+        # on the ScheduledReminder for all later next-run calculations
+        try:
+            cron = _new_cron(cron_expression, datetime.now())
+        except CroniterError:
+            raise ValueError(f"Invalid cron expression: {cron_expression}") from None
         
-        cron = croniter(cron_expression, datetime.now())
         next_run = cron.get_next(datetime)
         
         with self._lock:
-            self.reminders[name] = ScheduledReminder(
+            reminder = ScheduledReminder(
                 name=name,
                 cron_expression=cron_expression,
                 callback=callback,
-                next_run=next_run
+                next_run=next_run,
+                parsed_cron=cron
             )
+            self.reminders[name] = reminder
+            self._push(reminder)
+        self._wake.set()
         
-        print(f"Scheduled reminder '{name}' - next run: {next_run}")
+        log.info("Scheduled reminder '%s' - next run: %s", name, next_run)
     
     def remove_reminder(self, name: str) -> None:
         """Remove a reminder from the scheduler."""
         with self._lock:
             if name in self.reminders:
                 del self.reminders[name]
+                del self._heap_seq[name]
+        self._wake.set()
     
     def snooze_reminder(self, name: str, seconds: int) -> None:
         """Snooze a reminder for the specified duration."""
         with self._lock:
-            if name in self.reminders:
-                snoozed_until = self.reminders[name].snooze(seconds)
-                print(f"Snoozed '{name}' until {snoozed_until}")
+            if name not in self.reminders:
+                return
+            snoozed_until = self.reminders[name].snooze(seconds)
+            self._push(self.reminders[name])
+        self._wake.set()
+        
+        log.info("Snoozed '%s' until %s", name, snoozed_until)
     
     def complete_reminder(self, name: str) -> None:
         """Mark a reminder as complete and schedule next occurrence."""
         with self._lock:
-            if name in self.reminders:
-                self.reminders[name].clear_snooze()
-                next_run = self.reminders[name].next_run
-                print(f"Completed '{name}' - next run: {next_run}")
+            if name not in self.reminders:
+                return
+            self.reminders[name].clear_snooze()
+            self._push(self.reminders[name])
+            next_run = self.reminders[name].next_run
+        self._wake.set()
+        
+        log.info("Completed '%s' - next run: %s", name, next_run)
     
     def start(self) -> None:
         """Start the scheduler background thread."""
@@ -116,64 +178,101 @@ class ReminderScheduler:
             return
         
         self._running = True
+        if self._executor is None:
+            self._executor = self._create_executor()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
-        print("Scheduler started")
+        log.info("Scheduler started")
     
     def stop(self) -> None:
         """Stop the scheduler."""
         self._running = False
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=2.0)
-        print("Scheduler stopped")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        log.info("Scheduler stopped")
+    
+    def _create_executor(self) -> ThreadPoolExecutor:
+        """Create the pool that runs reminder callbacks; its threads start on first use."""
+        return ThreadPoolExecutor(
+            max_workers=self.CALLBACK_WORKERS,
+            thread_name_prefix="reminder-callback"
+        )
+    
+    def _push(self, reminder: ScheduledReminder) -> None:
+        """(Re)schedule a reminder on the heap, superseding any earlier entry. Caller holds the lock."""
+        seq = next(self._seq)
+        due = reminder.snoozed_until or reminder.next_run
+        self._heap_seq[reminder.name] = seq
+        heapq.heappush(self._heap, (due.timestamp(), seq, reminder.name))
     
     def _run_loop(self) -> None:
         """Main scheduler loop."""
         while self._running:
-            now = datetime.now()
-            current_minute = now.minute
-            
-            # Reset triggered set when minute changes
-            if self._last_minute != current_minute:
-                self._triggered_this_minute.clear()
-                self._last_minute = current_minute
-            
-            with self._lock:
-                for name, reminder in list(self.reminders.items()):
-                    # Skip if already triggered this minute
-                    if name in self._triggered_this_minute:
-                        continue
-                    
-                    effective_time = reminder.get_effective_next_run()
-                    
-                    # Check if reminder is due
-                    if now >= effective_time:
-                        self._triggered_this_minute.add(name)
-                        
-                        # Clear snooze if it was a snoozed trigger
-                        if reminder.snoozed_until:
-                            reminder.snoozed_until = None
-                        
-                        # Calculate next regular run
-                        reminder.calculate_next_run()
-                        
-                        # Trigger callback in separate thread to not block scheduler
-                        threading.Thread(
-                            target=reminder.callback,
-                            args=(name,),
-                            daemon=True
-                        ).start()
+            # Clear before checking so a change made during the check still wakes the wait
+            self._wake.clear()
+            self._wake.wait(self._check_due(datetime.now()))
+    
+    def _check_due(self, now: datetime) -> float:
+        """
+        Trigger every reminder that is due at `now`.
+        
+        Returns:
+            Seconds to sleep before the next check
+        """
+        # The heap works on float timestamps; wall-clock (not monotonic) time is
+        # used so that reminders due while the machine was suspended fire on resume
+        now_ts = now.timestamp()
+        due: List[Tuple[Callable[[str], None], str]] = []
+        
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now_ts:
+                _, seq, name = heapq.heappop(self._heap)
+                
+                # Skip entries superseded by a later snooze/complete or a removal
+                if self._heap_seq.get(name) != seq:
+                    continue
+                
+                reminder = self.reminders[name]
+                
+                # Clear snooze if it was a snoozed trigger
+                reminder.snoozed_until = None
+                
+                # Calculate next regular run and put it back on the heap; it is
+                # always after `now`, so the reminder can't fire twice for one due time
+                reminder.calculate_next_run(now)
+                self._push(reminder)
+                
+                due.append((reminder.callback, name))
             
-            time.sleep(self.CHECK_INTERVAL)
+            until_next = self._heap[0][0] - now_ts if self._heap else self.CHECK_INTERVAL
+        
+        # Hand callbacks to the pool after releasing the lock, so GUI-thread calls
+        # like snooze_reminder never wait on thread-pool bookkeeping
+        executor = self._executor
+        if executor is not None:
+            for callback, name in due:
+                executor.submit(callback, name)
+        
+        return max(0.0, min(self.CHECK_INTERVAL, until_next))
     
     def get_status(self) -> Dict[str, dict]:
         """Get the status of all scheduled reminders."""
-        status = {}
+        # Copy the times under the lock and format them after releasing it
         with self._lock:
-            for name, reminder in self.reminders.items():
-                status[name] = {
-                    "next_run": reminder.next_run.isoformat(),
-                    "snoozed_until": reminder.snoozed_until.isoformat() if reminder.snoozed_until else None,
-                    "effective_next": reminder.get_effective_next_run().isoformat()
-                }
+            snapshot = [
+                (name, reminder.next_run, reminder.snoozed_until, reminder.get_effective_next_run())
+                for name, reminder in self.reminders.items()
+            ]
+        
+        status = {}
+        for name, next_run, snoozed_until, effective_next in snapshot:
+            status[name] = {
+                "next_run": next_run.isoformat(),
+                "snoozed_until": snoozed_until.isoformat() if snoozed_until else None,
+                "effective_next": effective_next.isoformat()
+            }
         return status
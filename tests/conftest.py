@@ -0,0 +1,43 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+import signal
+from pathlib import Path
+
+import pytest
+
+from reminder_system.config import ConfigManager
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def preserve_sigint():
+    """Restore the SIGINT handler and signal wakeup fd after a test that replaces them."""
+    original_handler = signal.getsignal(signal.SIGINT)
+    original_wakeup_fd = signal.set_wakeup_fd(-1)
+    signal.set_wakeup_fd(original_wakeup_fd)
+    yield
+    signal.signal(signal.SIGINT, original_handler)
+    signal.set_wakeup_fd(original_wakeup_fd)
+
+
+@pytest.fixture(scope="session")
+def loaded_manager(tmp_path_factory):
+    """A ConfigManager with the fixture config loaded once for the whole session; treat it as read-only."""
+    # Load a copy, so nothing the load writes can end up in the source tree
+    config_dir = tmp_path_factory.mktemp("fixtures")
+    shutil.copytree(FIXTURES_DIR, config_dir, dirs_exist_ok=True)
+    manager = ConfigManager(config_dir, cache_dir=tmp_path_factory.mktemp("cache"))
+    manager.load_config()
+    return manager
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication shared by every test that builds Qt objects."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -24,16 +24,18 @@ import sys
 import signal
 import argparse
 from pathlib import Path
-
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from typing import TYPE_CHECKING
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from reminder_system.overlay import ReminderOverlay
 from reminder_system.config import ConfigManager
 
+# Qt and the overlay are imported where they are used, so importing this
+# module (e.g. during test collection) doesn't load Qt
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication
+
 
 # Directory containing test fixtures
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -42,6 +44,9 @@ EXAMPLE_CONFIG_DIR = Path(__file__).parent.parent / "example_config"
 
 def on_completed(name: str):
     """Handle reminder completion."""
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    
     print(f"\n✓ Reminder '{name}' marked as COMPLETE")
     print("Exiting in 1 second...")
     QTimer.singleShot(1000, QApplication.quit)
@@ -49,11 +54,21 @@ def on_completed(name: str):
 
 def on_snoozed(name: str, duration: int):
     """Handle reminder snooze."""
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    
     print(f"\n⏰ Reminder '{name}' SNOOZED for {duration} seconds")
     print("Exiting in 1 second...")
     QTimer.singleShot(1000, QApplication.quit)
 
 
+def _build_app() -> "QApplication":
+    """Return the running QApplication, creating one only if there is none yet."""
+    from PyQt6.QtWidgets import QApplication
+    
+    return QApplication.instance() or QApplication(sys.argv)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Manually trigger a reminder overlay for testing"
@@ -71,8 +86,11 @@ def main():
     
     args = parser.parse_args()
     
+    from PyQt6.QtCore import QTimer
+    from reminder_system.overlay import ReminderOverlay
+    
     # Create Qt application
-    app = QApplication(sys.argv)
+    app = _build_app()
     app.setApplicationName("Reminder Test")
     
     # Handle Ctrl+C
@@ -15,31 +15,42 @@ Usage:
 """
 
 import sys
-import signal
 from pathlib import Path
-
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from typing import TYPE_CHECKING
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from reminder_system.app import ReminderApp
+# Qt and the app (which pulls in Qt) are imported in main(), so importing this
+# module (e.g. during test collection) doesn't load Qt
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication
 
 
 # Directory containing test fixtures
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+def _build_app() -> "QApplication":
+    """Return the running QApplication, creating one only if there is none yet."""
+    from PyQt6.QtWidgets import QApplication
+    
+    return QApplication.instance() or QApplication(sys.argv)
+
+
 def main():
+    from reminder_system.app import ReminderApp, install_sigint_handler, setup_logging
+    
     print("=" * 50)
     print("REMINDER SYSTEM - TEST MODE")
     print("=" * 50)
     print(f"Using config from: {FIXTURES_DIR}")
     print("=" * 50)
     
+    log_listener = setup_logging()
+    
     # Create Qt application
-    app = QApplication(sys.argv)
+    app = _build_app()
     app.setQuitOnLastWindowClosed(False)
     app.setApplicationName("Reminder System (Test)")
     
@@ -50,19 +61,19 @@ def main():
     )
     
     if not reminder_app.initialize():
+        log_listener.stop()
         print("\nFailed to initialize. Make sure tests/fixtures/config.toml exists.")
         sys.exit(1)
     
     # Handle Ctrl+C
-    signal.signal(signal.SIGINT, lambda *_: reminder_app._quit())
-    timer = QTimer()
-    timer.timeout.connect(lambda: None)
-    timer.start(500)
+    reminder_app.sigint_handler = install_sigint_handler(reminder_app._quit)
     
     # Start the application
     reminder_app.run()
     
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    log_listener.stop()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""Unit tests for the app module."""
+
+import os
+import signal
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6 import QtGui
+
+from reminder_system.app import ReminderApp, install_sigint_handler
+
+
+REMINDERS = {
+    "first": {"schedule": "0 * * * *", "icon": "first.png"},
+    "second": {"schedule": "30 * * * *", "icon": "second.png"},
+}
+
+
+@pytest.fixture
+def app(qapp, tmp_path):
+    """Create a ReminderApp with two reminders and a mocked overlay display."""
+    reminder_app = ReminderApp(config_dir=tmp_path, enable_tray=False, cache_dir=tmp_path / "cache")
+    reminder_app.config_manager.load_from_data(REMINDERS)
+    reminder_app._show_reminder = Mock(
+        side_effect=lambda config: setattr(reminder_app, "active_reminder", config)
+    )
+    return reminder_app
+
+
+class TestReminderTriggering:
+    """Tests for routing reminder triggers onto the main thread."""
+    
+    def test_trigger_on_main_thread_shows_immediately(self, app):
+        """Test that a trigger on the main thread is handled without the event loop."""
+        app._trigger_reminder_threadsafe("first")
+        
+        app._show_reminder.assert_called_once()
+        assert app._show_reminder.call_args.args[0].name == "first"
+    
+    def test_trigger_from_worker_thread_is_delivered_by_event_loop(self, app, qapp):
+        """Test that a trigger from another thread is queued to the main thread."""
+        worker = threading.Thread(target=app._trigger_reminder_threadsafe, args=("first",))
+        worker.start()
+        worker.join()
+        
+        app._show_reminder.assert_not_called()
+        
+        qapp.processEvents()
+        
+        app._show_reminder.assert_called_once()
+    
+    def test_trigger_reminder_queues_while_another_is_showing(self, app):
+        """Test that a manual trigger waits for the reminder already on screen."""
+        assert app.trigger_reminder("first")
+        assert app.trigger_reminder("second")
+        
+        app._show_reminder.assert_called_once()
+        assert [config.name for config in app.reminder_queue] == ["second"]
+    
+    def test_trigger_reminder_unknown_name(self, app):
+        """Test that triggering an unknown reminder is rejected."""
+        assert not app.trigger_reminder("missing")
+        app._show_reminder.assert_not_called()
+    
+
+class TestTrayIcon:
+    """Tests for the cached tray icon."""
+    
+    def test_corrupt_tray_icon_cache_is_rerendered(self, qapp, tmp_path):
+        """Test that an unreadable cached tray icon is rendered again and overwritten."""
+        QtGui.QPixmapCache.clear()
+        icon_cache = tmp_path / ReminderApp.TRAY_ICON_CACHE
+        icon_cache.write_bytes(b"\x89PNG truncated")
+        
+        icon = ReminderApp(config_dir=tmp_path, enable_tray=False, cache_dir=tmp_path)._load_tray_icon()
+        
+        assert not icon.isNull()
+        assert not QtGui.QPixmap(str(icon_cache)).isNull()
+    
+    def test_tray_icon_is_cached_outside_config_dir(self, qapp, tmp_path):
+        """Test that the rendered tray icon goes to the cache directory, not the config directory."""
+        QtGui.QPixmapCache.clear()
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        
+        ReminderApp(config_dir=config_dir, enable_tray=False, cache_dir=tmp_path / "cache")._load_tray_icon()
+        
+        assert list(config_dir.iterdir()) == []
+        assert (tmp_path / "cache" / ReminderApp.TRAY_ICON_CACHE).exists()
+
+
+def _wakeup_fd():
+    """Return the current signal wakeup fd without changing it."""
+    fd = signal.set_wakeup_fd(-1)
+    signal.set_wakeup_fd(fd)
+    return fd
+
+
+class TestSigintHandler:
+    """Tests for the Ctrl+C handler installed by install_sigint_handler."""
+    
+    def test_sigint_runs_handler_until_uninstalled(self, qapp, preserve_sigint):
+        """Test that SIGINT calls the handler and uninstall() restores the previous state."""
+        previous_handler = signal.getsignal(signal.SIGINT)
+        previous_wakeup_fd = _wakeup_fd()
+        handler = Mock()
+        
+        installed = install_sigint_handler(handler)
+        assert _wakeup_fd() == installed.write_sock.fileno()
+        signal.raise_signal(signal.SIGINT)
+        
+        handler.assert_called_once_with()
+        
+        installed.uninstall()
+        
+        assert signal.getsignal(signal.SIGINT) is previous_handler
+        assert _wakeup_fd() == previous_wakeup_fd
+        assert installed.read_sock.fileno() == -1
@@ -1,8 +1,10 @@
 """Unit tests for the config module."""
 
 import pytest
+import re
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-import tempfile
+from unittest.mock import patch
 
 from reminder_system.config import (
     ReminderConfig,
@@ -15,81 +17,75 @@ from reminder_system.config import (
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+_MISSING_SCHEDULE_RE = re.compile(r"missing 'schedule' field")
+_MISSING_ICON_RE = re.compile(r"missing 'icon' field")
+_MISSING_ALL_RE = re.compile(r"missing 'icon', 'schedule' fields")
+
+
+@pytest.fixture(scope="class")
+def valid_config():
+    """A ReminderConfig built once per test class; it is frozen, so tests can share it."""
+    settings = {
+        "schedule": "0 * * * *",
+        "icon": "test.png",
+        "snooze_duration": 120
+    }
+    return ReminderConfig.from_dict("test", settings, Path("/tmp"))
+
 
 class TestReminderConfig:
     """Tests for ReminderConfig dataclass."""
     
-    def test_from_dict_valid(self):
+    def test_from_dict_valid(self, valid_config):
         """Test creating config from valid dictionary."""
-        settings = {
-            "schedule": "0 * * * *",
-            "icon": "test.png",
-            "snooze_duration": 120
-        }
-        config = ReminderConfig.from_dict("test", settings, Path("/tmp"))
-        
-        assert config.name == "test"
-        assert config.schedule == "0 * * * *"
-        assert config.icon == "test.png"
-        assert config.snooze_duration == 120
-        assert config.icon_path == Path("/tmp/test.png")
-    
-    def test_from_dict_missing_schedule(self):
-        """Test that missing schedule raises ValueError."""
-        settings = {"icon": "test.png"}
-        with pytest.raises(ValueError, match="missing 'schedule'"):
-            ReminderConfig.from_dict("test", settings, Path("/tmp"))
+        assert valid_config.name == "test"
+        assert valid_config.schedule == "0 * * * *"
+        assert valid_config.icon == "test.png"
+        assert valid_config.snooze_duration == 120
+        assert valid_config.icon_path == Path("/tmp/test.png")
     
-    def test_from_dict_missing_icon(self):
-        """Test that missing icon raises ValueError."""
-        settings = {"schedule": "0 * * * *"}
-        with pytest.raises(ValueError, match="missing 'icon'"):
+    @pytest.mark.parametrize("settings,pattern", [
+        ({"icon": "test.png"}, _MISSING_SCHEDULE_RE),
+        ({"schedule": "0 * * * *"}, _MISSING_ICON_RE),
+        ({}, _MISSING_ALL_RE),
+    ])
+    def test_from_dict_missing_required(self, settings, pattern):
+        """Test that missing required fields raise ValueError naming each of them."""
+        with pytest.raises(ValueError, match=pattern):
             ReminderConfig.from_dict("test", settings, Path("/tmp"))
     
-    def test_from_dict_default_snooze(self):
-        """Test that snooze_duration defaults to 300."""
-        settings = {
-            "schedule": "0 * * * *",
-            "icon": "test.png"
-        }
-        config = ReminderConfig.from_dict("test", settings, Path("/tmp"))
-        assert config.snooze_duration == 300
-    
-    def test_from_dict_with_text(self):
-        """Test creating config with optional text field."""
-        settings = {
-            "schedule": "0 * * * *",
-            "icon": "test.png",
-            "text": "Time to take a break!"
-        }
+    @pytest.mark.parametrize("extra,attr,expected", [
+        ({}, "snooze_duration", 300),
+        ({}, "text", None),
+        ({"text": "Time to take a break!"}, "text", "Time to take a break!"),
+    ])
+    def test_from_dict_optional_fields(self, extra, attr, expected):
+        """Test the optional fields, both defaulted and provided."""
+        settings = {"schedule": "0 * * * *", "icon": "test.png", **extra}
         config = ReminderConfig.from_dict("test", settings, Path("/tmp"))
         
-        assert config.text == "Time to take a break!"
+        assert getattr(config, attr) == expected
     
-    def test_from_dict_without_text(self):
-        """Test that text defaults to None when not provided."""
-        settings = {
-            "schedule": "0 * * * *",
-            "icon": "test.png"
-        }
-        config = ReminderConfig.from_dict("test", settings, Path("/tmp"))
-        
-        assert config.text is None
+    def test_is_frozen(self, valid_config):
+        """Test that ReminderConfig instances are immutable."""
+        with pytest.raises(FrozenInstanceError):
+            valid_config.schedule = "* * * * *"
 
 
 class TestGeneralConfig:
     """Tests for GeneralConfig dataclass."""
     
-    def test_default_values(self):
+    @pytest.mark.parametrize("attr,expected", [
+        ("text_font", "Sans Serif"),
+        ("text_size", 24),
+        ("icon_scale", 1.0),
+        ("max_opacity", 0.85),
+        ("fade_in_duration", 2000),
+        ("fade_out_duration", 500),
+    ])
+    def test_default_values(self, attr, expected):
         """Test that GeneralConfig has correct default values."""
-        config = GeneralConfig()
-        
-        assert config.text_font == "Sans Serif"
-        assert config.text_size == 24
-        assert config.icon_scale == 1.0
-        assert config.max_opacity == 0.85
-        assert config.fade_in_duration == 2000
-        assert config.fade_out_duration == 500
+        assert getattr(GeneralConfig(), attr) == expected
     
     def test_from_dict_full(self):
         """Test creating GeneralConfig from dictionary with all values."""
@@ -125,6 +121,13 @@ class TestGeneralConfig:
         assert config.fade_in_duration == 2000  # default
         assert config.fade_out_duration == 500  # default
     
+    def test_from_dict_ignores_unknown_keys(self):
+        """Test that unknown keys in the general section are ignored."""
+        config = GeneralConfig.from_dict({"text_size": 30, "unknown_option": True})
+        
+        assert config.text_size == 30
+        assert not hasattr(config, "unknown_option")
+    
     def test_from_dict_empty(self):
         """Test creating GeneralConfig from empty dictionary uses defaults."""
         config = GeneralConfig.from_dict({})
@@ -132,6 +135,9 @@ class TestGeneralConfig:
         assert config.text_font == "Sans Serif"
         assert config.text_size == 24
         assert config.icon_scale == 1.0
+
+
+class TestParseConfigData:
     """Tests for parse_config_data function."""
     
     def test_parse_multiple_reminders(self):
@@ -224,6 +230,20 @@ class TestGeneralConfig:
         assert general.text_font == "Sans Serif"
         assert general.text_size == 24
         assert general.icon_scale == 1.0
+    
+    def test_parse_warns_on_missing_icon(self, tmp_path, caplog):
+        """Test that only reminders with missing icons produce a warning."""
+        (tmp_path / "present.png").write_bytes(b"")
+        config_data = {
+            "present": {"schedule": "0 * * * *", "icon": "present.png"},
+            "missing": {"schedule": "0 * * * *", "icon": "missing.png"}
+        }
+        
+        parse_config_data(config_data, tmp_path)
+        
+        output = caplog.text
+        assert "missing.png" in output
+        assert "present.png" not in output
 
 
 class TestConfigManager:
@@ -240,47 +260,48 @@ class TestConfigManager:
         manager = ConfigManager()
         assert manager.config_dir == Path.home() / ".config" / "reminder-system"
     
+    def test_default_cache_dir(self, monkeypatch, tmp_path):
+        """Test that the default cache directory follows XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert ConfigManager._default_cache_dir.__wrapped__() == tmp_path / "reminder-system"
+    
     def test_default_general_config(self):
         """Test that ConfigManager has default GeneralConfig."""
         manager = ConfigManager()
         assert manager.general is not None
         assert manager.general.text_font == "Sans Serif"
     
-    def test_load_config_file_not_found(self):
+    def test_load_config_file_not_found(self, tmp_path):
         """Test loading non-existent config file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = ConfigManager(Path(tmpdir))
-            with pytest.raises(FileNotFoundError):
-                manager.load_config()
+        manager = ConfigManager(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            manager.load_config()
     
-    def test_load_config_from_fixtures(self):
+    def test_load_config_from_fixtures(self, loaded_manager):
         """Test loading config from fixtures directory."""
-        manager = ConfigManager(FIXTURES_DIR)
-        reminders = manager.load_config()
+        reminders = loaded_manager.reminders
         
         assert len(reminders) >= 1
         assert "test_reminder" in reminders
         
         # Check that general config was loaded
-        assert manager.general is not None
+        assert loaded_manager.general is not None
     
-    def test_load_config_with_general_settings(self):
+    def test_load_config_with_general_settings(self, loaded_manager):
         """Test that general settings are loaded from fixtures."""
-        manager = ConfigManager(FIXTURES_DIR)
-        manager.load_config()
+        general = loaded_manager.general
         
         # The fixture has general settings
-        assert manager.general.text_font == "Sans Serif"
-        assert manager.general.text_size == 24
-        assert manager.general.icon_scale == 1.0
-        assert manager.general.max_opacity == 0.85
-        assert manager.general.fade_in_duration == 2000
-        assert manager.general.fade_out_duration == 500
+        assert general.text_font == "Sans Serif"
+        assert general.text_size == 24
+        assert general.icon_scale == 1.0
+        assert general.max_opacity == 0.85
+        assert general.fade_in_duration == 2000
+        assert general.fade_out_duration == 500
     
-    def test_load_config_reminder_with_text(self):
+    def test_load_config_reminder_with_text(self, loaded_manager):
         """Test that reminder text is loaded from fixtures."""
-        manager = ConfigManager(FIXTURES_DIR)
-        reminders = manager.load_config()
+        reminders = loaded_manager.reminders
         
         # The fixture has a test_reminder with text
         assert "test_reminder" in reminders
@@ -343,3 +364,140 @@ class TestLoadConfigFile:
         """Test loading a file that doesn't exist."""
         with pytest.raises(FileNotFoundError):
             load_config_file(Path("/nonexistent/config.toml"))
+
+
+class TestConfigCache:
+    """Tests for the parsed config cache in ConfigManager."""
+    
+    CONFIG = '''
+[general]
+text_size = 30
+
+[cached_reminder]
+schedule = "0 * * * *"
+icon = "icon.png"
+'''
+    
+    def test_load_config_writes_cache(self, tmp_path):
+        """Test that loading the config creates the cache file."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        manager = ConfigManager(tmp_path, cache_dir=tmp_path / "cache")
+        manager.load_config()
+        
+        assert manager.cache_file.exists()
+    
+    def test_load_config_leaves_config_dir_untouched(self, tmp_path):
+        """Test that the cache is written to cache_dir, never next to config.toml."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "config.toml").write_text(self.CONFIG)
+        
+        ConfigManager(config_dir, cache_dir=tmp_path / "cache").load_config()
+        
+        assert [path.name for path in config_dir.iterdir()] == ["config.toml"]
+    
+    def test_load_config_without_cache(self, tmp_path):
+        """Test that use_cache=False parses the file and writes no cache."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        manager = ConfigManager(tmp_path, cache_dir=tmp_path / "cache", use_cache=False)
+        
+        reminders = manager.load_config()
+        
+        assert "cached_reminder" in reminders
+        assert manager.cache_file is None
+        assert not (tmp_path / "cache").exists()
+    
+    def test_load_config_unwritable_cache_dir(self, tmp_path, caplog):
+        """Test that a cache that can't be written is logged and the config still loads."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        (tmp_path / "cache").write_bytes(b"")  # A file, so the cache directory can't be created
+        
+        reminders = ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        
+        assert "cached_reminder" in reminders
+        assert "Could not write config cache" in caplog.text
+    
+    def test_load_config_uses_cache(self, tmp_path):
+        """Test that an unchanged config file is served from the cache."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        
+        manager = ConfigManager(tmp_path, cache_dir=tmp_path / "cache")
+        with patch("reminder_system.config.load_config_file") as load_file:
+            reminders = manager.load_config()
+        
+        load_file.assert_not_called()
+        assert reminders["cached_reminder"].schedule == "0 * * * *"
+        assert manager.general.text_size == 30
+    
+    def test_load_config_invalidates_cache(self, tmp_path):
+        """Test that modifying the config file invalidates the cache."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(self.CONFIG)
+        ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        
+        config_file.write_text(self.CONFIG.replace("0 * * * *", "*/15 * * * *"))
+        reminders = ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        
+        assert reminders["cached_reminder"].schedule == "*/15 * * * *"
+    
+    def test_load_config_ignores_other_cache_version(self, tmp_path):
+        """Test that a cache written with a different CACHE_VERSION is rebuilt."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        
+        manager = ConfigManager(tmp_path, cache_dir=tmp_path / "cache")
+        with patch.object(ConfigManager, "CACHE_VERSION", ConfigManager.CACHE_VERSION + 1), \
+                patch("reminder_system.config.load_config_file", wraps=load_config_file) as load_file:
+            manager.load_config()
+        
+        load_file.assert_called_once()
+    
+    def test_load_config_ignores_corrupt_cache(self, tmp_path):
+        """Test that a corrupt cache file falls back to parsing."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        manager = ConfigManager(tmp_path, cache_dir=tmp_path / "cache")
+        manager.cache_dir.mkdir()
+        manager.cache_file.write_bytes(b"garbage")
+        
+        reminders = manager.load_config()
+        
+        assert "cached_reminder" in reminders
+    
+    def test_load_config_reload_skips_cache_file(self, tmp_path):
+        """Test that reloading an unchanged config on the same manager doesn't touch the cache file."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        manager = ConfigManager(tmp_path, cache_dir=tmp_path / "cache")
+        manager.load_config()
+        
+        with patch.object(ConfigManager, "_read_cache") as read_cache:
+            reminders = manager.load_config()
+        
+        read_cache.assert_not_called()
+        assert "cached_reminder" in reminders
+    
+    def test_load_config_ignores_cache_from_other_config_dir_spelling(self, tmp_path, monkeypatch):
+        """Test that a cache written via a relative config_dir isn't reused from another cwd."""
+        config_dir = tmp_path / "cfg"
+        config_dir.mkdir()
+        (config_dir / "config.toml").write_text(self.CONFIG)
+        
+        monkeypatch.chdir(tmp_path)
+        ConfigManager(Path("cfg"), cache_dir=tmp_path / "cache").load_config()
+        
+        monkeypatch.chdir(config_dir)
+        reminders = ConfigManager(config_dir, cache_dir=tmp_path / "cache").load_config()
+        
+        assert reminders["cached_reminder"].icon_path == config_dir / "icon.png"
+    
+    def test_load_config_warns_on_missing_icon_from_cache(self, tmp_path, caplog):
+        """Test that an icon deleted after the cache was written is still reported."""
+        (tmp_path / "config.toml").write_text(self.CONFIG)
+        (tmp_path / "icon.png").write_bytes(b"")
+        ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        caplog.clear()
+        
+        (tmp_path / "icon.png").unlink()
+        ConfigManager(tmp_path, cache_dir=tmp_path / "cache").load_config()
+        
+        assert "icon.png" in caplog.text
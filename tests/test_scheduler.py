@@ -1,6 +1,7 @@
 """Unit tests for the scheduler module."""
 
 import pytest
+import threading
 import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -8,6 +9,21 @@ from unittest.mock import Mock, patch
 from reminder_system.scheduler import ReminderScheduler, ScheduledReminder
 
 
+NOW = datetime(2024, 1, 1, 12, 0, 30)
+
+
+def _noop(name):
+    """Reminder callback for tests that never check whether it was called."""
+
+
+@pytest.fixture
+def scheduler_with_test():
+    """A fresh scheduler with an hourly reminder named 'test'."""
+    scheduler = ReminderScheduler()
+    scheduler.add_reminder("test", "0 * * * *", _noop)
+    return scheduler
+
+
 class TestScheduledReminder:
     """Tests for ScheduledReminder dataclass."""
     
@@ -16,37 +32,36 @@ class TestScheduledReminder:
         reminder = ScheduledReminder(
             name="test",
             cron_expression="* * * * *",  # Every minute
-            callback=Mock(),
-            next_run=datetime.now()
+            callback=_noop,
+            next_run=NOW
         )
         
-        next_run = reminder.calculate_next_run()
+        next_run = reminder.calculate_next_run(NOW)
         
-        # Should be within the next minute
-        assert next_run > datetime.now()
-        assert next_run < datetime.now() + timedelta(minutes=2)
+        # Should be the start of the next minute
+        assert next_run == datetime(2024, 1, 1, 12, 1)
+        assert reminder.next_run == next_run
     
     def test_snooze(self):
         """Test snoozing a reminder."""
         reminder = ScheduledReminder(
             name="test",
             cron_expression="0 * * * *",
-            callback=Mock(),
-            next_run=datetime.now()
+            callback=_noop,
+            next_run=NOW
         )
         
-        snoozed_until = reminder.snooze(300)  # 5 minutes
+        snoozed_until = reminder.snooze(300, NOW)  # 5 minutes
         
-        assert reminder.snoozed_until is not None
-        assert snoozed_until > datetime.now()
-        assert snoozed_until < datetime.now() + timedelta(seconds=310)
+        assert snoozed_until == datetime(2024, 1, 1, 12, 5, 30)
+        assert reminder.snoozed_until == snoozed_until
     
     def test_clear_snooze(self):
         """Test clearing snooze."""
         reminder = ScheduledReminder(
             name="test",
             cron_expression="* * * * *",
-            callback=Mock(),
+            callback=_noop,
             next_run=datetime.now()
         )
         
@@ -58,32 +73,54 @@ class TestScheduledReminder:
     
     def test_get_effective_next_run_no_snooze(self):
         """Test effective next run without snooze."""
-        next_run = datetime.now() + timedelta(hours=1)
+        next_run = datetime(2024, 1, 1, 13, 0)
         reminder = ScheduledReminder(
             name="test",
             cron_expression="0 * * * *",
-            callback=Mock(),
+            callback=_noop,
             next_run=next_run
         )
         
-        assert reminder.get_effective_next_run() == next_run
+        assert reminder.get_effective_next_run(NOW) == next_run
     
     def test_get_effective_next_run_with_snooze(self):
         """Test effective next run with active snooze."""
-        next_run = datetime.now() + timedelta(hours=1)
+        next_run = datetime(2024, 1, 1, 13, 0)
         reminder = ScheduledReminder(
             name="test",
             cron_expression="0 * * * *",
-            callback=Mock(),
+            callback=_noop,
             next_run=next_run
         )
         
-        reminder.snooze(60)
-        effective = reminder.get_effective_next_run()
+        reminder.snooze(60, NOW)
         
         # Should return snooze time, not scheduled time
-        assert effective < next_run
-        assert effective > datetime.now()
+        assert reminder.get_effective_next_run(NOW) == datetime(2024, 1, 1, 12, 1, 30)
+    
+    def test_get_effective_next_run_after_snooze_expires(self):
+        """Test effective next run falls back to the schedule once the snooze has passed."""
+        next_run = datetime(2024, 1, 1, 13, 0)
+        reminder = ScheduledReminder(
+            name="test",
+            cron_expression="0 * * * *",
+            callback=_noop,
+            next_run=next_run
+        )
+        
+        reminder.snooze(60, NOW)
+        
+        assert reminder.get_effective_next_run(NOW + timedelta(minutes=2)) == next_run
+    
+    def test_reminders_with_same_cron_are_independent(self):
+        """Test that reminders sharing a cron expression don't share iterator state."""
+        first = ScheduledReminder(name="first", cron_expression="0 * * * *", callback=_noop, next_run=NOW)
+        second = ScheduledReminder(name="second", cron_expression="0 * * * *", callback=_noop, next_run=NOW)
+        
+        first.calculate_next_run(NOW + timedelta(hours=5))
+        
+        assert second.calculate_next_run(NOW) == datetime(2024, 1, 1, 13, 0)
+        assert first.next_run == datetime(2024, 1, 1, 18, 0)
 
 
 class TestReminderScheduler:
@@ -92,9 +129,8 @@ class TestReminderScheduler:
     def test_add_reminder(self):
         """Test adding a reminder."""
         scheduler = ReminderScheduler()
-        callback = Mock()
         
-        scheduler.add_reminder("test", "0 * * * *", callback)
+        scheduler.add_reminder("test", "0 * * * *", _noop)
         
         assert "test" in scheduler.reminders
         assert scheduler.reminders["test"].name == "test"
@@ -105,12 +141,11 @@ class TestReminderScheduler:
         scheduler = ReminderScheduler()
         
         with pytest.raises(ValueError, match="Invalid cron expression"):
-            scheduler.add_reminder("test", "invalid cron", Mock())
+            scheduler.add_reminder("test", "invalid cron", _noop)
     
-    def test_remove_reminder(self):
+    def test_remove_reminder(self, scheduler_with_test):
         """Test removing a reminder."""
-        scheduler = ReminderScheduler()
-        scheduler.add_reminder("test", "0 * * * *", Mock())
+        scheduler = scheduler_with_test
         
         assert "test" in scheduler.reminders
         
@@ -118,19 +153,17 @@ class TestReminderScheduler:
         
         assert "test" not in scheduler.reminders
     
-    def test_snooze_reminder(self):
+    def test_snooze_reminder(self, scheduler_with_test):
         """Test snoozing a reminder."""
-        scheduler = ReminderScheduler()
-        scheduler.add_reminder("test", "0 * * * *", Mock())
+        scheduler = scheduler_with_test
         
         scheduler.snooze_reminder("test", 120)
         
         assert scheduler.reminders["test"].snoozed_until is not None
     
-    def test_complete_reminder(self):
+    def test_complete_reminder(self, scheduler_with_test):
         """Test completing a reminder."""
-        scheduler = ReminderScheduler()
-        scheduler.add_reminder("test", "0 * * * *", Mock())
+        scheduler = scheduler_with_test
         scheduler.snooze_reminder("test", 60)
         
         scheduler.complete_reminder("test")
@@ -140,8 +173,8 @@ class TestReminderScheduler:
     def test_get_status(self):
         """Test getting scheduler status."""
         scheduler = ReminderScheduler()
-        scheduler.add_reminder("test1", "0 * * * *", Mock())
-        scheduler.add_reminder("test2", "30 * * * *", Mock())
+        scheduler.add_reminder("test1", "0 * * * *", _noop)
+        scheduler.add_reminder("test2", "30 * * * *", _noop)
         
         status = scheduler.get_status()
         
@@ -153,11 +186,102 @@ class TestReminderScheduler:
     def test_start_stop(self):
         """Test starting and stopping the scheduler."""
         scheduler = ReminderScheduler()
-        scheduler.add_reminder("test", "0 * * * *", Mock())
+        scheduler.add_reminder("test", "0 * * * *", _noop)
         
-        scheduler.start()
-        assert scheduler._running
-        assert scheduler._thread is not None
+        # Only the start/stop state machine is under test; don't start a real loop thread
+        with patch("reminder_system.scheduler.threading.Thread") as thread_cls:
+            scheduler.start()
+            assert scheduler._running
+            assert scheduler._thread is thread_cls.return_value
+            thread_cls.return_value.start.assert_called_once()
+            
+            scheduler.stop()
         
-        scheduler.stop()
         assert not scheduler._running
+        thread_cls.return_value.join.assert_called_once()
+        assert scheduler._executor is None
+    
+    @pytest.mark.slow
+    def test_running_scheduler_fires_due_reminder(self):
+        """Test that the real loop thread wakes on a schedule change and runs the callback."""
+        fired = threading.Event()
+        scheduler = ReminderScheduler()
+        scheduler.add_reminder("test", "0 0 1 1 *", lambda name: fired.set())  # Once a year
+        
+        scheduler.start()
+        try:
+            scheduler.snooze_reminder("test", 0)  # Due right now
+            assert fired.wait(timeout=2.0)
+        finally:
+            scheduler.stop()
+        
+        assert not scheduler._thread.is_alive()
+    
+    def test_check_due_triggers_due_reminder(self):
+        """Test that a reminder fires once its next run time is reached."""
+        scheduler = ReminderScheduler()
+        callback = Mock()
+        scheduler.add_reminder("test", "0 * * * *", callback)
+        due = scheduler.reminders["test"].next_run
+        
+        scheduler._executor = Mock()
+        
+        scheduler._check_due(due - timedelta(seconds=1))
+        scheduler._executor.submit.assert_not_called()
+        
+        scheduler._check_due(due)
+        scheduler._executor.submit.assert_called_once_with(callback, "test")
+    
+    def test_check_due_triggers_snoozed_reminder(self):
+        """Test that a snoozed reminder fires when its snooze expires."""
+        scheduler = ReminderScheduler()
+        scheduler.add_reminder("test", "0 0 1 1 *", _noop)  # Once a year
+        scheduler.snooze_reminder("test", 60)
+        snoozed_until = scheduler.reminders["test"].snoozed_until
+        
+        scheduler._executor = Mock()
+        
+        scheduler._check_due(snoozed_until)
+        
+        scheduler._executor.submit.assert_called_once()
+        assert scheduler.reminders["test"].snoozed_until is None
+    
+    def test_check_due_skips_removed_reminder(self, scheduler_with_test):
+        """Test that a removed reminder never fires."""
+        scheduler = scheduler_with_test
+        due = scheduler.reminders["test"].next_run
+        scheduler.remove_reminder("test")
+        
+        scheduler._executor = Mock()
+        
+        scheduler._check_due(due)
+        
+        scheduler._executor.submit.assert_not_called()
+    
+    def test_check_due_fires_once_per_due_time(self):
+        """Test that repeated checks in the same minute don't fire a reminder twice."""
+        scheduler = ReminderScheduler()
+        scheduler.add_reminder("test", "* * * * *", _noop)
+        due = scheduler.reminders["test"].next_run
+        scheduler._executor = Mock()
+        
+        scheduler._check_due(due)
+        scheduler._check_due(due + timedelta(seconds=30))
+        
+        scheduler._executor.submit.assert_called_once()
+        assert scheduler.reminders["test"].next_run == due + timedelta(minutes=1)
+    
+    def test_check_due_fires_short_snooze_in_same_minute(self):
+        """Test that a snooze expiring in the minute the reminder fired still fires."""
+        scheduler = ReminderScheduler()
+        scheduler.add_reminder("test", "0 * * * *", _noop)
+        due = scheduler.reminders["test"].next_run
+        scheduler._executor = Mock()
+        
+        scheduler._check_due(due)
+        scheduler.reminders["test"].snoozed_until = due + timedelta(seconds=20)
+        with scheduler._lock:
+            scheduler._push(scheduler.reminders["test"])
+        scheduler._check_due(due + timedelta(seconds=20))
+        
+        assert scheduler._executor.submit.call_count == 2